@@ -22,12 +22,12 @@ class CxTowerFile(models.Model):
     # This is needed for YAML import
     server_id = fields.Many2one(
         comodel_name="cx.tower.server",
-        compute="_compute_git_project_id",
+        compute="_compute_server_id",
         store=True,
         readonly=False,
     )
 
-    @api.depends("git_project_rel_ids.server_id", "git_project_rel_ids.git_project_id")
+    @api.depends("git_project_rel_ids.git_project_id")
     def _compute_git_project_id(self):
         """
         Link to project using the proxy model.
@@ -35,20 +35,18 @@ class CxTowerFile(models.Model):
         for record in self:
             # File is related to project via proxy model.
             # So there can be only one record in o2m field.
-            git_project_relation = (
-                record.git_project_rel_ids and record.git_project_rel_ids[0]
-            )
+            record.git_project_id = record.git_project_rel_ids[:1].git_project_id
+
+    @api.depends("git_project_rel_ids.server_id")
+    def _compute_server_id(self):
+        """
+        Get server from the project relation.
+        Computed separately from the project to avoid
+        recomputing the server when only the project is changed.
+        """
+        for record in self:
+            git_project_relation = record.git_project_rel_ids[:1]
+            # Keep the server if there is no relation
+            # as file still belongs to the server
             if git_project_relation:
-                record.update(
-                    {
-                        "git_project_id": git_project_relation.git_project_id,
-                        "server_id": git_project_relation.server_id,
-                    }
-                )
-            else:
-                # Reset only git project id as file still belongs to the server
-                record.update(
-                    {
-                        "git_project_id": False,
-                    }
-                )
+                record.server_id = git_project_relation.server_id
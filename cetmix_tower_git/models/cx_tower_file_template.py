@@ -27,6 +27,4 @@ class CxTowerFileTemplate(models.Model):
         for record in self:
             # File is related to project via proxy model.
             # So there can be only one record in o2m field.
-            record.git_project_id = (
-                record.git_project_ids and record.git_project_ids[0].id
-            )
+            record.git_project_id = record.git_project_ids[:1]
@@ -4,6 +4,10 @@
 import re
 
 from odoo import _, api, fields, models
+from odoo.exceptions import ValidationError
+
+# Environment variables denoted as $VAR or ${VAR}, e.g., $FOO or ${FOO_BAR123}
+VARIABLE_PATTERN = re.compile(r"\$\{?([A-Z0-9_]+)\}?")
 
 
 class CxTowerGitProject(models.Model):
@@ -149,6 +153,39 @@ class CxTowerGitProject(models.Model):
         """
         return "git_aggregator"
 
+    def _get_code_generator_function(self, project_format):
+        """Get code generator function for the project format.
+        Following the pattern: _generate_code_<format> where format
+        is one of the values in _selection_project_format.
+
+        IMPORTANT: generated code must depend only on the project
+        and the format. It is generated once per project and format
+        and reused for all files and file templates linked to it.
+
+        Args:
+            project_format (Char): Project format
+
+        Raises:
+            ValidationError: If function is not found
+
+        Returns:
+            Function: Code generator function bound to the project.
+                Must be called with a single record to generate code for,
+                eg `function(record)`.
+        """
+        code_generator_function = getattr(
+            self, f"_generate_code_{project_format}", None
+        )
+        if not code_generator_function:
+            raise ValidationError(
+                _(
+                    "Code generator function for '%(project_format)s'"
+                    " format not found.",
+                    project_format=project_format,
+                )
+            )
+        return code_generator_function
+
     @api.depends(
         "git_project_rel_ids.server_id",
         "git_project_rel_ids.server_id.user_ids",
@@ -164,56 +201,65 @@ class CxTowerGitProject(models.Model):
         This is done to avoid unpredictable consequences when some of the servers
         are not updated due to access restrictions when a project is updated.
         """
+        # Prefetch users and managers of all related servers at once
+        servers = self.git_project_rel_ids.server_id
+        servers.fetch(["user_ids", "manager_ids"])
+
+        # Check the "Manager" group for all server users at once
+        # instead of calling `has_group` for each of them
+        manager_group = self.env.ref("cetmix_tower_server.group_manager")
+        tower_manager_ids = set(
+            servers.user_ids.filtered(lambda u: manager_group in u.groups_id).ids
+        )
+
+        # Collect users and managers of each server once for all projects
+        users_by_server = {}
+        managers_by_server = {}
+        for server in servers:
+            manager_ids = set(server.manager_ids.ids)
+            managers_by_server[server.id] = manager_ids
+            users_by_server[server.id] = manager_ids.union(server.user_ids.ids)
+
         for project in self:
-            # Do not compute if no servers are related
+            # Do not compute if no servers are related.
+            # Unlike `server_ids`, mapped servers contain no duplicates
+            # so each server is checked only once.
             server_ids = project.git_project_rel_ids.server_id
             if not server_ids:
                 continue
 
-            # Get all user and manager ids from related servers
-            all_user_ids = server_ids.user_ids.filtered(
-                lambda u: u.has_group("cetmix_tower_server.group_manager")
-            ).ids
-            all_manager_ids = server_ids.manager_ids.ids
-
-            # Create a final list of user and manager ids
-            user_ids = []
-            manager_ids = []
-            # Check if user is present in all servers
-            for user_id in all_user_ids:
-                if all(
-                    user_id in server.user_ids.ids or user_id in server.manager_ids.ids
-                    for server in server_ids
-                ):
-                    user_ids.append(user_id)
-            # Check if manager is present in all servers
-            for manager_id in all_manager_ids:
-                if all(manager_id in server.manager_ids.ids for server in server_ids):
-                    manager_ids.append(manager_id)
+            # Get all user ids from related servers
+            all_user_ids = tower_manager_ids.intersection(server_ids.user_ids.ids)
 
-            # Set the final lists
-            project.update(
-                {
-                    "user_ids": [(6, 0, user_ids)],
-                    "manager_ids": [(6, 0, manager_ids)],
-                }
+            # Keep only users and managers present in all servers
+            user_ids = all_user_ids.intersection(
+                *(users_by_server[server_id] for server_id in server_ids.ids)
+            )
+            manager_ids = set.intersection(
+                *(managers_by_server[server_id] for server_id in server_ids.ids)
             )
 
+            # Set the final lists
+            project.user_ids = [(6, 0, list(user_ids))]
+            project.manager_ids = [(6, 0, list(manager_ids))]
+
     @api.depends(
         "source_ids", "source_ids.remote_ids", "source_ids.remote_ids.is_private"
     )
     def _compute_has_private_remotes(self):
         for project in self:
-            project.has_private_remotes = any(
-                source.remote_count > 0
-                and source.remote_count_private == source.remote_count
-                for source in project.source_ids
-            )
-            project.has_partially_private_remotes = any(
-                source.remote_count_private > 0
-                and source.remote_count_private != source.remote_count
-                for source in project.source_ids
-            )
+            has_private_remotes = has_partially_private_remotes = False
+            for source in project.source_ids:
+                remote_count = source.remote_count
+                remote_count_private = source.remote_count_private
+                if remote_count > 0 and remote_count_private == remote_count:
+                    has_private_remotes = True
+                elif remote_count_private > 0:
+                    has_partially_private_remotes = True
+                if has_private_remotes and has_partially_private_remotes:
+                    break
+            project.has_private_remotes = has_private_remotes
+            project.has_partially_private_remotes = has_partially_private_remotes
 
     @api.model_create_multi
     def create(self, vals_list):
@@ -242,10 +288,8 @@ class CxTowerGitProject(models.Model):
         Returns:
             List: List of variables
         """
-        # This regex will find all variables where variables are denoted
-        # as $VAR or ${VAR}, e.g., $FOO or ${FOO_BAR123}
-        variables = re.findall(r"\$\{?([A-Z0-9_]+)\}?", text)
-        return sorted(list(set(variables)))
+        variables = VARIABLE_PATTERN.findall(text)
+        return sorted(set(variables))
 
     # ------------------------------
     # YAML mixin methods
@@ -270,18 +314,14 @@ class CxTowerGitProject(models.Model):
             Dict: Json structure for git aggregator
         """
         self.ensure_one()
-        values = {}
-        for source in self.source_ids:
-            if source.enabled and source.remote_count:
-                root_dir = self.git_aggregator_root_dir or "."
-                values.update(
-                    {
-                        f"/{source.reference}"
-                        if root_dir == "/"
-                        else f"{root_dir}/{source.reference}": source._git_aggregator_prepare_record()  # noqa: E501
-                    }
-                )
-        return values
+        root_dir = self.git_aggregator_root_dir or "."
+        # Avoid double slash when sources are cloned to the root directory
+        prefix = "" if root_dir == "/" else root_dir
+        return {
+            f"{prefix}/{source.reference}": source._git_aggregator_prepare_record()
+            for source in self.source_ids
+            if source.enabled and source.remote_count
+        }
 
     def _git_aggregator_prepare_yaml_comment(self, yaml_code):
         """Generate commentary for yaml file.
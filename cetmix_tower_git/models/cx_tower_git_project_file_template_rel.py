@@ -1,8 +1,10 @@
 # Copyright (C) 2024 Cetmix OÜ
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
-from odoo import _, api, fields, models
-from odoo.exceptions import ValidationError
+from collections import defaultdict
+
+from odoo import api, fields, models
+from odoo.tools.sql import create_index
 
 
 class CxTowerGitProjectFileTemplateRel(models.Model):
@@ -44,6 +46,16 @@ class CxTowerGitProjectFileTemplateRel(models.Model):
         ),
     ]
 
+    def init(self):
+        super().init()
+        # Used to resolve file template relations, eg in file template views
+        create_index(
+            self._cr,
+            "cx_tower_git_project_file_template_rel_template_project_index",
+            self._table,
+            ["file_template_id", "git_project_id"],
+        )
+
     @api.model_create_multi
     def create(self, vals_list):
         res = super().create(vals_list)
@@ -54,8 +66,9 @@ class CxTowerGitProjectFileTemplateRel(models.Model):
 
     def write(self, vals):
         res = super().write(vals)
-        # Export project to file
-        self._save_to_file_template()
+        # Export project to file only if generated code can change
+        if any(field in vals for field in self._get_code_field_names()):
+            self._save_to_file_template()
         return res
 
     def action_open_file_template(self):
@@ -76,40 +89,58 @@ class CxTowerGitProjectFileTemplateRel(models.Model):
     # ----------------------------------------------------
     # Save project to linked file based on selected format
     # ----------------------------------------------------
+    def _get_code_field_names(self):
+        """
+        Return the list of field names that affect the code
+        saved to the linked file template
+        """
+        return ["git_project_id", "file_template_id", "project_format"]
+
     def _save_to_file_template(self):
-        """Save project to linked file using format-specific function."""
+        """Save project to linked file using format-specific function.
 
-        # Get required function based on project format
-        # Following the pattern: _generate_code__<format> where format
-        # is one of the values in _selection_project_format
-        # Function gets a single record as an argument.
+        Set 'skip_git_project_save' context key to skip saving.
+        It is set when writing the code to prevent re-entrant saves
+        caused by the linked file template updates.
+        """
+        if self.env.context.get("skip_git_project_save"):
+            return
+
+        # Prefetch related records to avoid reading them one by one
+        self.fetch(["file_template_id", "git_project_id", "project_format"])
+        self.file_template_id.fetch(["code"])
+        self.git_project_id.fetch(["source_ids", "git_aggregator_root_dir"])
+
+        # Generated code by project and format.
+        # Generated code must depend only on the project and format
+        # (see `_get_code_generator_function` of the project), so it is
+        # generated once even if the project is linked to many records.
+        project_codes = {}
 
-        # Save resolved functions to dict for faster access
-        code_generator_functions = {}
+        # Generated code by file template id
+        template_codes = {}
 
         for record in self:
-            code_generator_function = code_generator_functions.get(
-                record.project_format
-            )
-            if not code_generator_function:
-                code_generator_function = getattr(
-                    record.git_project_id,
-                    f"_generate_code_{record.project_format}",
-                    None,
-                )
-                if not code_generator_function:
-                    raise ValidationError(
-                        _(
-                            "Code generator function for '%(project_format)s'"
-                            " format not found.",
-                            project_format=record.project_format,
-                        )
-                    )
-                code_generator_functions[record.project_format] = (
-                    code_generator_function
+            # Generate code for current record
+            code_key = (record.git_project_id.id, record.project_format)
+            code = project_codes.get(code_key)
+            if code is None:
+                git_project = record.git_project_id
+                code_generator_function = git_project._get_code_generator_function(
+                    record.project_format
                 )
+                code = code_generator_function(record)
+                project_codes[code_key] = code
+            template_codes[record.file_template_id.id] = code
 
-            # Generate code for current record
-            code = code_generator_function(record)
-            if record.file_template_id.code != code:
-                record.file_template_id.write({"code": code})
+        # Group file templates by code to update them in batches
+        template_ids_by_code = defaultdict(list)
+        templates = self.env["cx.tower.file.template"].browse(list(template_codes))
+        for template in templates:
+            code = template_codes[template.id]
+            if template.code != code:
+                template_ids_by_code[code].append(template.id)
+        for code, template_ids in template_ids_by_code.items():
+            templates.browse(template_ids).with_context(
+                skip_git_project_save=True
+            ).write({"code": code})
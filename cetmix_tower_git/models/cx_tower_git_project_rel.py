@@ -1,8 +1,11 @@
 # Copyright (C) 2024 Cetmix OÜ
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+from collections import defaultdict
+
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.tools.sql import create_index
 
 
 class CxTowerGitProjectRel(models.Model):
@@ -58,6 +61,16 @@ class CxTowerGitProjectRel(models.Model):
         ),
     ]
 
+    def init(self):
+        super().init()
+        # Used to resolve file relations, eg in file git project compute
+        create_index(
+            self._cr,
+            "cx_tower_git_project_rel_file_project_server_index",
+            self._table,
+            ["file_id", "git_project_id", "server_id"],
+        )
+
     @api.constrains("server_id", "file_id")
     def _check_server_file_relation(self):
         """
@@ -86,8 +99,9 @@ class CxTowerGitProjectRel(models.Model):
 
     def write(self, vals):
         res = super().write(vals)
-        # Export project to file
-        self._save_to_file()
+        # Export project to file only if generated code can change
+        if any(field in vals for field in self._get_code_field_names()):
+            self._save_to_file()
         return res
 
     def action_open_project(self):
@@ -123,47 +137,72 @@ class CxTowerGitProjectRel(models.Model):
     # ----------------------------------------------------
     # Save project to linked file based on selected format
     # ----------------------------------------------------
-    def _save_to_file(self):
-        """Save project to linked file using format-specific function."""
-
-        # Get required function based on project format
-        # Following the pattern: _generate_code_<format> where format
-        # is one of the values in _selection_project_format
-        # Function gets a single record as an argument.
-
-        # Save resolved functions to dict for faster access
-        code_generator_functions = {}
+    def _get_code_field_names(self):
+        """
+        Return the list of field names that affect the code
+        saved to the linked file
+        """
+        return ["git_project_id", "file_id", "project_format"]
 
-        for record in self:
-            # Disconnect file from file template if it is connected
-            if record.file_id.template_id:
-                record.file_id.action_unlink_from_template()
+    def _save_to_file(self):
+        """Save project to linked file using format-specific function.
 
-            code_generator_function = code_generator_functions.get(
-                record.project_format
+        Set 'skip_git_project_save' context key to skip saving.
+        It is set when writing the code to prevent re-entrant saves
+        caused by the linked file updates.
+        """
+        if self.env.context.get("skip_git_project_save"):
+            return
+
+        # Prefetch related records to avoid reading them one by one
+        self.fetch(["file_id", "git_project_id", "project_format"])
+        self.file_id.fetch(["template_id", "code"])
+        self.git_project_id.fetch(["source_ids", "git_aggregator_root_dir"])
+
+        # Generated code by project and format.
+        # Generated code must depend only on the project and format
+        # (see `_get_code_generator_function` of the project), so it is
+        # generated once even if the project is linked to many records.
+        project_codes = {}
+
+        # Generated code by file id
+        file_codes = {}
+
+        # Disconnect files from file templates if they are connected.
+        # Same as `action_unlink_from_template` but for all files at once.
+        files_with_template = self.file_id.filtered("template_id")
+        if files_with_template:
+            files_with_template.with_context(skip_git_project_save=True).write(
+                {"template_id": False}
             )
-            if not code_generator_function:
-                code_generator_function = getattr(
-                    record.git_project_id,
-                    f"_generate_code_{record.project_format}",
-                    None,
-                )
-                if not code_generator_function:
-                    raise ValidationError(
-                        _(
-                            "Code generator function for '%(project_format)s'"
-                            " format not found.",
-                            project_format=record.project_format,
-                        )
-                    )
-                code_generator_functions[record.project_format] = (
-                    code_generator_function
-                )
 
+        for record in self:
             # Generate code for current record
-            code = code_generator_function(record)
-            if record.file_id.code != code:
-                record.file_id.write({"code": code})
+            code_key = (record.git_project_id.id, record.project_format)
+            code = project_codes.get(code_key)
+            if code is None:
+                git_project = record.git_project_id
+                code_generator_function = git_project._get_code_generator_function(
+                    record.project_format
+                )
+                code = code_generator_function(record)
+                project_codes[code_key] = code
+            file_codes[record.file_id.id] = code
+
+        # Group files by code to update them in batches
+        file_ids_by_code = defaultdict(list)
+        files = self.env["cx.tower.file"].browse(list(file_codes))
+        for file in files:
+            code = file_codes[file.id]
+            if file.code != code:
+                file_ids_by_code[code].append(file.id)
+        # Use ORM instead of plain SQL to keep file synchronization
+        # and computed fields working. The ORM flushes pending updates
+        # of all groups together anyway.
+        for code, file_ids in file_ids_by_code.items():
+            files.browse(file_ids).with_context(skip_git_project_save=True).write(
+                {"code": code}
+            )
 
     # ------------------------------
     # YAML mixin methods
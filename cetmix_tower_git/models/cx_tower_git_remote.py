@@ -1,9 +1,15 @@
 # Copyright (C) 2024 Cetmix OÜ
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
-import giturlparse
-
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.tools.sql import create_index
+
+# Repository URL fields by remote protocol
+URL_FIELD_BY_PROTOCOL = {
+    "https": "url",
+    "ssh": "url_ssh",
+    "git": "url_git",
+}
 
 
 class CxTowerGitRemote(models.Model):
@@ -83,6 +89,18 @@ class CxTowerGitRemote(models.Model):
         index=True,
     )
 
+    def init(self):
+        super().init()
+        # Used to find enabled remotes by repository and head,
+        # eg in `get_servers_by_git_ref` of the server
+        create_index(
+            self._cr,
+            "cx_tower_git_remote_repo_head_index",
+            self._table,
+            ["repo_id", "head_type", "head"],
+            where="enabled",
+        )
+
     def _get_default_url_protocol(self):
         """Default URL protocol for new remote.
 
@@ -91,7 +109,7 @@ class CxTowerGitRemote(models.Model):
         """
         return "https"
 
-    @api.depends("source_id", "sequence")
+    @api.depends("source_id", "sequence", "source_id.remote_ids.sequence")
     def _compute_name(self):
         """
         Compute remote name.
@@ -99,10 +117,17 @@ class CxTowerGitRemote(models.Model):
         where position is the position of the remote in the source.
         Eg first remote is `remote_1`, second is `remote_2`, etc.
         """
-        for remote in self:
-            if remote.source_id:
-                for index, source_remote in enumerate(remote.source_id.remote_ids):
+        # Enumerate remotes of each source only once.
+        # Other remotes of the source are recomputed via dependencies.
+        named_remotes = []
+        for source in self.source_id:
+            for index, source_remote in enumerate(source.remote_ids):
+                if source_remote in self:
                     source_remote.name = f"remote_{index + 1}"
+                    named_remotes.append(source_remote.id)
+
+        # Remotes without a source get the default name
+        (self - self.browse(named_remotes)).name = "remote"
 
     @api.onchange("head")
     def onchange_head(self):
@@ -111,16 +136,15 @@ class CxTowerGitRemote(models.Model):
         and set it as head.
         """
         for remote in self:
-            if remote.head and "/" in remote.head:
+            if remote.head:
                 remote.head = self._sanitize_head(remote.head)
 
     @api.model_create_multi
     def create(self, vals_list):
         # Sanitize head
         for vals in vals_list:
-            head = vals.get("head")
-            if head and "/" in head:
-                vals["head"] = self._sanitize_head(head)
+            if vals.get("head"):
+                vals["head"] = self._sanitize_head(vals["head"])
         res = super().create(vals_list)
         # Export project to related files and templates
         res._update_related_files_and_templates()
@@ -128,13 +152,12 @@ class CxTowerGitRemote(models.Model):
 
     def write(self, vals):
         # Sanitize head
-        if "head" in vals:
-            head = vals["head"]
-            if head and "/" in head:
-                vals["head"] = self._sanitize_head(head)
+        if vals.get("head"):
+            vals["head"] = self._sanitize_head(vals["head"])
         res = super().write(vals)
-        # Update related files and templates on update
-        self._update_related_files_and_templates()
+        # Update related files and templates only if code may change
+        if any(field in vals for field in self._get_code_field_names()):
+            self._update_related_files_and_templates()
         return res
 
     def unlink(self):
@@ -146,15 +169,11 @@ class CxTowerGitRemote(models.Model):
 
         # Update related files and templates on unlink
         if projects:
-            file_relations = projects.git_project_rel_ids  # type: ignore
-            if file_relations:
-                file_relations._save_to_file()
-            template_relations = projects.git_project_file_template_rel_ids  # type: ignore
-            if template_relations:
-                template_relations._save_to_file_template()
+            projects._update_related_files_and_templates()
         return res
 
-    def _sanitize_head(self, head):
+    @staticmethod
+    def _sanitize_head(head):
         """Sanitize head.
         Extract head number from head url
         and set it as head.
@@ -165,20 +184,31 @@ class CxTowerGitRemote(models.Model):
         Returns:
             Char: Sanitized head
         """
-        if head and "/" in head:
-            return head.split("/")[-1].strip()
-        return head
+        if not head:
+            return head
+        index = head.rfind("/")
+        return head[index + 1 :].strip() if index >= 0 else head
+
+    def _get_code_field_names(self):
+        """
+        Return the list of field names that affect the code
+        generated for the related projects
+        """
+        return [
+            "enabled",
+            "sequence",
+            "source_id",
+            "repo_id",
+            "url_protocol",
+            "head_type",
+            "head",
+        ]
 
     def _update_related_files_and_templates(self):
-        # Update related files on update
-        related_files = self.mapped("git_project_id").mapped("git_project_rel_ids")
-        if related_files:
-            related_files._save_to_file()
-        related_templates = self.mapped("git_project_id").mapped(
-            "git_project_file_template_rel_ids"
-        )
-        if related_templates:
-            related_templates._save_to_file_template()
+        # Update related files and templates of all projects at once
+        projects = self.git_project_id
+        if projects:
+            projects._update_related_files_and_templates()
 
     # ------------------------------
     # Reference mixin methods
@@ -207,7 +237,9 @@ class CxTowerGitRemote(models.Model):
     # Git Aggregator related methods
     # ------------------------------
     def _git_aggregator_prepare_url(self):
-        """Prepare url for git aggregator
+        """Prepare url for git aggregator.
+        Following the pattern: _git_aggregator_prepare_url_<provider>
+        for private repositories using https protocol.
 
         Returns:
             Char: Prepared url for git aggregator
@@ -219,19 +251,20 @@ class CxTowerGitRemote(models.Model):
         if not self.repo_id.url:
             raise ValidationError(_("Repository URL is not set"))
 
-        url = self.repo_id.url
-        prepared_url = giturlparse.parse(url).urls.get(self.url_protocol, url)
+        # Repository already provides URLs for all protocols
+        url_field = URL_FIELD_BY_PROTOCOL.get(self.url_protocol, "url")
+        prepared_url = self.repo_id[url_field] or self.repo_id.url
 
         # If repo is public or is not using HTTPS protocol return URL as is
         if not self.is_private or self.url_protocol != "https":
             return prepared_url
 
-        if self.repo_provider == "github":
-            prepared_url = self._git_aggregator_prepare_url_github(prepared_url)
-        elif self.repo_provider == "gitlab":
-            prepared_url = self._git_aggregator_prepare_url_gitlab(prepared_url)
-        elif self.repo_provider == "bitbucket":
-            prepared_url = self._git_aggregator_prepare_url_bitbucket(prepared_url)
+        # Use provider specific function if any
+        prepare_url_function = getattr(
+            self, f"_git_aggregator_prepare_url_{self.repo_provider}", None
+        )
+        if prepare_url_function:
+            prepared_url = prepare_url_function(prepared_url)
 
         return prepared_url
 
@@ -245,7 +278,7 @@ class CxTowerGitRemote(models.Model):
         Returns:
             Char: Prepared url for git aggregator
         """
-        url_without_protocol = url.replace("https://", "")
+        url_without_protocol = url.removeprefix("https://")
         return f"https://{auth_token}@{url_without_protocol}"
 
     def _git_aggregator_prepare_url_github(self, url):
@@ -298,18 +331,20 @@ class CxTowerGitRemote(models.Model):
         )
 
     def _git_aggregator_prepare_head(self):
-        """Prepare head for git aggregator
+        """Prepare head for git aggregator.
+        Following the pattern: _git_aggregator_prepare_head_<provider>
+        where provider is the repository provider.
 
         Returns:
             Char: Prepared head for git aggregator
         """
         self.ensure_one()
-        if self.repo_provider == "github":
-            return self._git_aggregator_prepare_head_github()
-        if self.repo_provider == "gitlab":
-            return self._git_aggregator_prepare_head_gitlab()
-        if self.repo_provider == "bitbucket":
-            return self._git_aggregator_prepare_head_bitbucket()
+        # Use provider specific function if any
+        prepare_head_function = getattr(
+            self, f"_git_aggregator_prepare_head_{self.repo_provider}", None
+        )
+        if prepare_head_function:
+            return prepare_head_function()
         return self.head
 
     def _extract_head_number(self):
@@ -324,7 +359,7 @@ class CxTowerGitRemote(models.Model):
             Char: Extracted head number
         """
         self.ensure_one()
-        head_number = self.head.split("/")[-1]
+        head_number = self.head.rpartition("/")[2]
         if not head_number:
             raise ValidationError(
                 _("Git Aggregator: Head number is empty in %(head)s", head=self.head)
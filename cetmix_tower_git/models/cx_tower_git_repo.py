@@ -1,15 +1,12 @@
 # Copyright (C) 2024 Cetmix OÜ
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
-import logging
-
 import giturlparse
 
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.osv.expression import OR
 from odoo.tools import ormcache
 
-_logger = logging.getLogger(__name__)
-
 
 class CxTowerGitRepo(models.Model):
     """
@@ -139,23 +136,16 @@ class CxTowerGitRepo(models.Model):
         Compute name in format: host/owner/name.
         Compute reference based on name.
         """
-        for repo in self:
-            if repo.host and repo.owner_id and repo.repo:
-                name = f"{repo.host}/{repo.owner_id.name}/{repo.repo}"
-                reference = repo._generate_or_fix_reference(name)
-                repo.update(
-                    {
-                        "name": name,
-                        "reference": reference,
-                    }
-                )
-            else:
-                repo.update(
-                    {
-                        "name": False,
-                        "reference": False,
-                    }
-                )
+        incomplete = self.filtered(
+            lambda repo: not (repo.host and repo.owner_id and repo.repo)
+        )
+        incomplete.name = False
+        incomplete.reference = False
+        for repo in self - incomplete:
+            name = f"{repo.host}/{repo.owner_id.name}/{repo.repo}"
+            reference = repo._generate_or_fix_reference(name)
+            repo.name = name
+            repo.reference = reference
 
     @api.depends("remote_ids", "remote_ids.git_project_id")
     def _compute_git_project_ids(self):
@@ -177,50 +167,30 @@ class CxTowerGitRepo(models.Model):
 
     @api.depends("repo", "host", "owner_id")
     def _compute_url(self):
-        """Compute URL from repository properties."""
+        """Compute URL from repository properties.
+        URLs are composed directly from the repository properties.
+        Repositories without owner have no URL because such URLs
+        cannot be parsed back into the repository properties.
+        """
         for repo in self:
             if repo.repo and repo.host and repo.owner_id:
-                https_url = f"https://{repo.host}/{repo.owner_id.name}/{repo.repo}.git"
-            elif repo.repo and repo.host:
-                https_url = f"https://{repo.host}/{repo.repo}.git"
-            else:
-                https_url = ""
-            if https_url:
-                try:
-                    parsed_urls = giturlparse.parse(https_url).urls
-                    urls = {
-                        "url": https_url,
-                        "url_ssh": parsed_urls["ssh"],
-                        "url_git": parsed_urls["git"],
-                    }
-                except Exception as e:  # noqa: F841 catch all errors
-                    _logger.error(
-                        "Failed to parse constructed URL '%s' for repo %s",
-                        https_url,
-                        repo.display_name,
-                    )
-                    urls = {
-                        "url": "",
-                        "url_ssh": "",
-                        "url_git": "",
-                    }
+                path = f"{repo.owner_id.name}/{repo.repo}.git"
+                repo.url = f"https://{repo.host}/{path}"
+                repo.url_ssh = f"git@{repo.host}:{path}"
+                repo.url_git = f"git://{repo.host}/{path}"
             else:
-                urls = {
-                    "url": "",
-                    "url_ssh": "",
-                    "url_git": "",
-                }
-            repo.update(urls)
+                repo.url = ""
+                repo.url_ssh = ""
+                repo.url_git = ""
 
     def _inverse_url(self):
         """Parse URL to update repository properties."""
-        for repo in self:
-            if not repo.url:
-                continue
-            # Parse URL
-            parsed_url_dict = self._parse_url(repo.url)
+        repos = self.filtered("url")
+        # Parse all URLs at once
+        parsed_urls = self._parse_urls(repos.mapped("url"))
+        for repo in repos:
             # Update repository properties
-            repo.update(parsed_url_dict)
+            repo.update(parsed_urls[repo.url])
 
     def action_view_remotes(self):
         """Open remotes list view."""
@@ -259,19 +229,57 @@ class CxTowerGitRepo(models.Model):
         res = self.browse()
         existing_repo_ids = []
         vals_list_to_create = []
+
+        # Parse all URLs at once
+        parsed_urls = self._parse_urls(
+            [vals["url"] for vals in vals_list if vals.get("url")],
+            raise_if_invalid=True,
+        )
+
+        # Different URLs may point to the same repository
+        repo_keys = {
+            url: (
+                parsed_url_dict["repo"],
+                parsed_url_dict["host"],
+                parsed_url_dict["owner_id"],
+            )
+            for url, parsed_url_dict in parsed_urls.items()
+        }
+
+        # Get existing repositories using a single search
+        repo_ids_by_key = {}
+        if repo_keys:
+            domain = OR(
+                [
+                    [
+                        ("repo", "=", repo),
+                        ("host", "=", host),
+                        ("owner_id", "=", owner_id),
+                    ]
+                    for repo, host, owner_id in set(repo_keys.values())
+                ]
+            )
+            for repo in self.search(domain):
+                repo_ids_by_key.setdefault(
+                    (repo.repo, repo.host, repo.owner_id.id), repo.id
+                )
+
+        keys_to_create = set()
         for vals in vals_list:
             url = vals.get("url")
             if url:
-                # Try to get repository by URL
-                repo_id = self._get_repo_id_by_url(
-                    url=url, create=False, raise_if_invalid=False
-                )
+                repo_key = repo_keys[url]
+                # Use existing repository if found
+                repo_id = repo_ids_by_key.get(repo_key)
                 if repo_id:
                     existing_repo_ids.append(repo_id)
                     continue
-                # Parse URL and update vals
-                parsed_url_dict = self._parse_url(url=url, raise_if_invalid=True)
-                vals.update(parsed_url_dict)
+                # Create each repository only once
+                if repo_key in keys_to_create:
+                    continue
+                keys_to_create.add(repo_key)
+                # Update vals with parsed URL
+                vals.update(parsed_urls[url])
             # Add to create list (with or without URL)
             vals_list_to_create.append(vals)
         # Compose the result
@@ -279,20 +287,24 @@ class CxTowerGitRepo(models.Model):
             res |= super().create(vals_list_to_create)
         if existing_repo_ids:
             res |= self.browse(existing_repo_ids)
-        self.env.registry.clear_cache()
+        # Cache is cleared in the reference mixin if any repository is created
         return res
 
     def write(self, vals):
         """Write repositories."""
         res = super().write(vals)
-        self.env.registry.clear_cache()
+        # Clear cache only if repository lookup results may change
+        if any(field in vals for field in self._get_url_field_names()):
+            self.env.registry.clear_cache()
         return res
 
-    def unlink(self):
-        """Unlink repositories."""
-        res = super().unlink()
-        self.env.registry.clear_cache()
-        return res
+    def _get_url_field_names(self):
+        """Fields that affect repository lookup by URL.
+
+        Returns:
+            List: List of field names
+        """
+        return ["url", "repo", "host", "owner_id", "active"]
 
     @api.model
     def name_create(self, name):
@@ -356,30 +368,51 @@ class CxTowerGitRepo(models.Model):
             Dict: Dictionary with name, host and owner
             or empty dict if the URL is not valid and raise_if_invalid is False
         """
+        return self._parse_urls([url], raise_if_invalid=raise_if_invalid).get(url, {})
 
-        # Validate URL
-        if not giturlparse.validate(url):
-            if raise_if_invalid:
-                raise ValidationError(_("Not a valid repository URL!"))
-            return {}
+    def _parse_urls(self, urls, raise_if_invalid=True):
+        """Parse URLs to get name, host and owner.
+        Owners of all URLs are fetched and created at once.
 
-        # Parse URL
-        parsed_url = giturlparse.parse(url)
+        Args:
+            urls (List): URLs to parse
+
+        Raises:
+            ValidationError: If any of the URLs is not valid
+
+        Returns:
+            Dict: Dictionary with name, host and owner by URL.
+            Invalid URLs are skipped if raise_if_invalid is False
+        """
+        parsed_urls = {}
+        for url in urls:
+            if url in parsed_urls:
+                continue
 
-        # Get or create owner
-        owner_id = self.env["cx.tower.git.repo.owner"]._get_owner_id_by_name(
-            name=parsed_url.owner,
+            # Parse and validate URL at once.
+            # `giturlparse.validate` would parse the URL one more time.
+            parsed_url = giturlparse.parse(url)
+            if not parsed_url.valid:
+                if raise_if_invalid:
+                    raise ValidationError(_("Not a valid repository URL!"))
+                continue
+            parsed_urls[url] = parsed_url
+
+        # Get or create owners
+        owner_ids = self.env["cx.tower.git.repo.owner"]._get_owner_ids_by_names(
+            names=[parsed_url.owner for parsed_url in parsed_urls.values()],
             create=True,
         )
 
-        # Get provider based on host
-        provider = self._get_provider(parsed_url)
-
         return {
-            "repo": parsed_url.repo,
-            "host": parsed_url.host,
-            "owner_id": owner_id,
-            "provider": provider,
+            url: {
+                "repo": parsed_url.repo,
+                "host": parsed_url.host,
+                "owner_id": owner_ids.get(parsed_url.owner),
+                # Get provider based on host
+                "provider": self._get_provider(parsed_url),
+            }
+            for url, parsed_url in parsed_urls.items()
         }
 
     def _get_provider(self, parsed_url):
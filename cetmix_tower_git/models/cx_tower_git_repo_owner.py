@@ -2,7 +2,6 @@
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
 from odoo import api, fields, models
-from odoo.tools import ormcache
 
 
 class CxTowerGitRepoOwner(models.Model):
@@ -24,6 +23,12 @@ class CxTowerGitRepoOwner(models.Model):
     name = fields.Char(
         help="Name of the repository owner (e.g., 'cetmix', 'OCA')",
     )
+    name_key = fields.Char(
+        compute="_compute_name_key",
+        store=True,
+        index=True,
+        help="Lowercase owner name used to find owners regardless of case",
+    )
     reference = fields.Char(
         index=True,
         compute="_compute_display_name",
@@ -47,53 +52,66 @@ class CxTowerGitRepoOwner(models.Model):
     @api.depends("name")
     def _compute_display_name(self):
         """Compute display name."""
-        for owner in self:
+        unnamed = self.filtered(lambda owner: not owner.name)
+        unnamed.display_name = False
+        unnamed.reference = False
+        for owner in self - unnamed:
             # By default, display name is the same as name
             name = owner.name
-            owner.update(
-                {
-                    "display_name": name or False,
-                    "reference": owner._generate_or_fix_reference(name)
-                    if name
-                    else False,
-                }
-            )
+            reference = owner._generate_or_fix_reference(name)
+            owner.display_name = name
+            owner.reference = reference
+
+    @api.depends("name")
+    def _compute_name_key(self):
+        """Compute name key."""
+        for owner in self:
+            owner.name_key = owner.name.lower() if owner.name else False
 
-    @ormcache("self.env.uid", "self.env.su", "name", "create")
-    def _get_owner_id_by_name(self, name, create=False):
-        """Get owner id by name.
+    @api.model
+    def _get_owner_ids_by_names(self, names, create=False):
+        """Get owner ids by names using a single search.
+        Names are matched case-insensitively.
 
         Args:
-            name (str): Owner name
-            create (bool): Create owner if not found
+            names (list): Owner names
+            create (bool): Create owners that are not found
         Returns:
-            int: Owner ID or None if not found
+            dict: Owner ID or None if not found by owner name
         """
-        owner = self.search([("name", "=ilike", name)], limit=1) if name else None
-        if not owner and create and name:
-            owner = self.create({"name": name})
-        return owner.id if owner else None
+        # Keep the order of names to create owners with the first spelling
+        names = list(dict.fromkeys(name for name in names if name))
+        if not names:
+            return {}
 
-    @api.model_create_multi
-    def create(self, vals_list):
-        """Clear cache on create."""
-        res = super().create(vals_list)
-        self.env.registry.clear_cache()
-        return res
+        # Keep the first owner found for each name like a single search does
+        owner_ids = {}
+        name_keys = list({name.lower() for name in names})
+        for owner in self.search([("name_key", "in", name_keys)]):
+            owner_ids.setdefault(owner.name_key, owner.id)
+
+        # Create all missing owners at once
+        missing_names = {}
+        for name in names:
+            name_key = name.lower()
+            if name_key not in owner_ids:
+                missing_names.setdefault(name_key, name)
+        if missing_names and create:
+            owners = self.create([{"name": name} for name in missing_names.values()])
+            owner_ids.update(zip(missing_names, owners.ids))
+
+        return {name: owner_ids.get(name.lower()) for name in names}
 
     def write(self, vals):
-        """Clear cache on write."""
+        """Clear cache on write.
+        Cached repository lookups by URL depend on owner names.
+        Cache is cleared on create and unlink in the reference mixin.
+        """
         res = super().write(vals)
         if "name" in vals:
             self.env.registry.clear_cache()
         return res
 
-    def unlink(self):
-        """Clear cache on unlink."""
-        res = super().unlink()
-        self.env.registry.clear_cache()
-        return res
-
     # ------------------------------
     # YAML mixin methods
     # ------------------------------
@@ -1,5 +1,7 @@
 # Copyright (C) 2024 Cetmix OÜ
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+from collections import defaultdict
+
 from odoo import api, fields, models
 
 
@@ -43,15 +45,41 @@ class CxTowerGitSource(models.Model):
     remote_count = fields.Integer(
         compute="_compute_remote_count",
         string="Remotes",
+        store=True,
     )
     remote_count_private = fields.Integer(
         compute="_compute_remote_count",
         string="Private Remotes",
+        store=True,
     )
 
-    @api.depends("remote_ids", "remote_ids.enabled", "remote_ids.is_private")
+    @api.depends(
+        "remote_ids",
+        "remote_ids.active",
+        "remote_ids.enabled",
+        "remote_ids.is_private",
+    )
     def _compute_remote_count(self):
-        for record in self:
+        # Count remotes of saved sources using a single query
+        saved_sources = self.filtered("id")
+        if saved_sources:
+            remote_counts = defaultdict(int)
+            private_remote_counts = defaultdict(int)
+            remote_groups = self.env["cx.tower.git.remote"]._read_group(
+                domain=[("source_id", "in", saved_sources.ids), ("enabled", "=", True)],
+                groupby=["source_id", "is_private"],
+                aggregates=["__count"],
+            )
+            for source, is_private, count in remote_groups:
+                remote_counts[source.id] += count
+                if is_private:
+                    private_remote_counts[source.id] += count
+            for record in saved_sources:
+                record.remote_count = remote_counts[record.id]
+                record.remote_count_private = private_remote_counts[record.id]
+
+        # New sources (eg in onchange) may have unsaved remotes
+        for record in self - saved_sources:
             remote_count = private_remote_count = 0
             for remote in record.remote_ids:
                 if not remote.enabled:
@@ -59,12 +87,8 @@ class CxTowerGitSource(models.Model):
                 if remote.is_private:
                     private_remote_count += 1
                 remote_count += 1
-            record.update(
-                {
-                    "remote_count": remote_count,
-                    "remote_count_private": private_remote_count,
-                }
-            )
+            record.remote_count = remote_count
+            record.remote_count_private = private_remote_count
 
     @api.model_create_multi
     def create(self, vals_list):
@@ -80,10 +104,11 @@ class CxTowerGitSource(models.Model):
     def write(self, vals):
         res = super().write(vals)
         # Compose name
-        if "name" in vals and not vals.get("name"):
+        if "name" in vals and not vals["name"]:
             self._compose_name()
-        # Update related files and templates on update
-        self._update_related_files_and_templates()
+        # Update related files and templates only if code may change
+        if any(field in vals for field in self._get_code_field_names()):
+            self._update_related_files_and_templates()
         return res
 
     def unlink(self):
@@ -93,22 +118,20 @@ class CxTowerGitSource(models.Model):
         projects = self.git_project_id
         res = super().unlink()
 
-        # Update related files and templates on unlink
+        # Update related files and templates of all projects at once
         if projects:
-            file_relations = projects.git_project_rel_ids  # type: ignore
-            if file_relations:
-                file_relations._save_to_file()
-            template_relations = projects.git_project_file_template_rel_ids  # type: ignore
-            if template_relations:
-                template_relations._save_to_file_template()
+            projects._update_related_files_and_templates()
         return res
 
     def _compose_name(self):
         """Compose name if not provided explicitly"""
-        for source in self:
-            if source.name:
-                continue
-            remote = fields.first(source.remote_ids)
+        sources = self.filtered(lambda source: not source.name)
+        # Prefetch repositories and owners of all remotes at once
+        repos = sources.remote_ids.repo_id
+        repos.fetch(["repo", "owner_id"])
+        repos.owner_id.fetch(["name"])
+        for source in sources:
+            remote = source.remote_ids[:1]
             if not remote:
                 source.name = "Empty Source"
                 continue
@@ -119,16 +142,26 @@ class CxTowerGitSource(models.Model):
                 continue
             source.name = f"{remote_repo.owner_id.name}/{remote_repo.repo}"
 
+    def _get_code_field_names(self):
+        """
+        Return the list of field names that affect the code
+        generated for the related projects
+        """
+        return [
+            "active",
+            "enabled",
+            "name",
+            "reference",
+            "sequence",
+            "git_project_id",
+            "remote_ids",
+        ]
+
     def _update_related_files_and_templates(self):
-        # Update related files and templates on update
-        related_files = self.mapped("git_project_id").mapped("git_project_rel_ids")
-        if related_files:
-            related_files._save_to_file()
-        related_templates = self.mapped("git_project_id").mapped(
-            "git_project_file_template_rel_ids"
-        )
-        if related_templates:
-            related_templates._save_to_file_template()
+        # Update related files and templates of all projects at once
+        projects = self.git_project_id
+        if projects:
+            projects._update_related_files_and_templates()
 
     # ------------------------------
     # Reference mixin methods
@@ -162,22 +195,28 @@ class CxTowerGitSource(models.Model):
         """
         self.ensure_one()
 
+        enabled_remotes = self.remote_ids.filtered("enabled")
+
+        # Prefetch repository data used to prepare URLs and heads
+        repos = enabled_remotes.repo_id
+        repos.fetch(["repo", "host", "owner_id", "provider", "is_private"])
+        repos.owner_id.fetch(["name"])
+
         # Prepare remotes, merges and target
         remotes = {}
         merges = []
         target = None
-        for remote in self.remote_ids:
-            if remote.enabled:
-                remotes.update({remote.name: remote._git_aggregator_prepare_url()})
-                merges.append(
-                    {
-                        "remote": remote.name,
-                        "ref": remote._git_aggregator_prepare_head(),
-                    }
-                )
-                # Set target to first remote name
-                if not target:
-                    target = remote.name
+        for remote in enabled_remotes:
+            remotes.update({remote.name: remote._git_aggregator_prepare_url()})
+            merges.append(
+                {
+                    "remote": remote.name,
+                    "ref": remote._git_aggregator_prepare_head(),
+                }
+            )
+            # Set target to first remote name
+            if not target:
+                target = remote.name
 
         # If no remotes, return empty dict
         if not remotes:
@@ -11,23 +11,30 @@ class CxTowerServer(models.Model):
         comodel_name="cx.tower.git.project.rel",
         inverse_name="server_id",
         copy=False,
-        depends=["git_project_ids"],
         groups="cetmix_tower_server.group_manager,cetmix_tower_server.group_root",
     )
 
     # Helper field to get all git projects related to server
-    # IMPORTANT: This field may contain duplicates because of the relation nature!
     git_project_ids = fields.Many2many(
         comodel_name="cx.tower.git.project",
-        relation="cx_tower_git_project_rel",
-        column1="server_id",
-        column2="git_project_id",
-        readonly=True,
+        compute="_compute_git_project_ids",
+        search="_search_git_project_ids",
         copy=False,
-        depends=["git_project_rel_ids"],
         groups="cetmix_tower_server.group_manager,cetmix_tower_server.group_root",
     )
 
+    @api.depends("git_project_rel_ids.git_project_id")
+    def _compute_git_project_ids(self):
+        """Compute git projects from file relations.
+        Unlike reading the relation table directly,
+        mapped projects contain no duplicates.
+        """
+        for server in self:
+            server.git_project_ids = server.git_project_rel_ids.git_project_id
+
+    def _search_git_project_ids(self, operator, value):
+        return [("git_project_rel_ids.git_project_id", operator, value)]
+
     # ------------------------------
     # YAML mixin methods
     # ------------------------------
@@ -45,17 +52,26 @@ class CxTowerServer(models.Model):
         res += ["cx.tower.file"]
         return res
 
+    def _get_create_immediately_models(self):
+        """List of models whose related records are always created
+        immediately when resolved from YAML.
+
+        Files must be created immediately because they are related
+        to both server and git project.
+        So if a file is not created immediately when it is created
+        for the server, the same file will be created for the git project.
+        This will lead to creation of two files with the same content
+        for the same server.
+
+        Returns:
+            List: list of model names
+        """
+        return ["cx.tower.file"]
+
     def _update_or_create_related_record(
         self, model, reference, values, create_immediately=False
     ):
-        # Files must be created immediately because they are related
-        # to both server and git project.
-        # So if a file is not created immediately when it is created
-        # for the server, the same file will be created for the git project.
-        # This will lead to creation of two files with the same content
-        # for the same server.
-
-        if model._name == "cx.tower.file":
+        if model._name in self._get_create_immediately_models():
             create_immediately = True
         return super()._update_or_create_related_record(
             model, reference, values, create_immediately=create_immediately
@@ -95,10 +111,10 @@ class CxTowerServer(models.Model):
         )
         if not repo_id:
             return server_obj
-        repo = self.env["cx.tower.git.repo"].browse(repo_id)
 
         # Compose domain for remotes
         remote_domain = [
+            ("repo_id", "=", repo_id),
             ("source_id.enabled", "=", True),
             ("enabled", "=", True),
         ]
@@ -108,14 +124,23 @@ class CxTowerServer(models.Model):
         if head_type:
             remote_domain.append(("head_type", "=", head_type))
 
-        # Get remotes
-        remotes = repo.remote_ids.filtered_domain(remote_domain)
+        # Get remotes using a single query instead of
+        # reading all remotes of the repository and filtering them.
+        # Source is joined automatically because of `auto_join`.
+        # Only remote projects are taken from the superuser search.
+        remotes = self.env["cx.tower.git.remote"].sudo().search(remote_domain)
         if not remotes:
             return server_obj
 
-        # Get servers from remotes
-        servers = remotes.mapped("git_project_id.git_project_rel_ids.server_id")
-        return servers
+        # Follow projects and their relations with the caller access rights,
+        # so servers are reached only through readable projects and relations
+        projects = (
+            self.env["cx.tower.git.project"]
+            .browse(remotes.git_project_id.ids)
+            ._filtered_access("read")
+        )
+        relations = projects.git_project_rel_ids._filtered_access("read")
+        return relations.server_id._filtered_access("read")
 
     def _command_runner_file_using_template_create_file(
         self,
@@ -137,13 +162,14 @@ class CxTowerServer(models.Model):
                 return file
 
             if plan_line.is_make_copy:
-                # Remove default_server_ids from context, because this relation
+                # Override default_server_ids from context, because this relation
                 # will be created through git_project_rel_ids.
                 # default_server_ids will interfere at the moment when
                 # pairs of values are created through SQL query
                 # in the method write_real and it does not take into account
-                # that in this case we are creating a copy of the git project
-                git_project = git_project.with_context(default_server_ids=False).copy()
+                # that in this case we are creating a copy of the git project.
+                # Explicit copy default takes precedence over the context default.
+                git_project = git_project.copy(default={"server_ids": False})
 
             self.env["cx.tower.git.project.rel"].create(
                 {
@@ -0,0 +1 @@
+Match git repository owners regardless of case, so repository URLs that differ only in owner case resolve to the same owner and repository.
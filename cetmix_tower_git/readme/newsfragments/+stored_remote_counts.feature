@@ -0,0 +1 @@
+Store the remote counts of git sources so that sources and projects can be filtered and sorted by them without recounting remotes. Existing sources are counted once when the module is upgraded.
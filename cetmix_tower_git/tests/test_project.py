@@ -53,20 +53,21 @@ class TestProject(CommonTest):
     def test_manager_read_access(self):
         """Test manager read access rules"""
         manager_project = self.GitProject.with_user(self.manager)
+        project_as_manager = manager_project.browse(self.project.id)
 
         # Manager not in user_ids or manager_ids - should not read
         with self.assertRaises(AccessError):
-            manager_project.browse(self.project.id).read(["name"])
+            project_as_manager.read(["name"])
 
         # Add manager to user_ids - should read
         self.project.write({"user_ids": [(4, self.manager.id)]})
-        self.assertEqual(manager_project.browse(self.project.id).name, "Test Project")
+        self.assertEqual(project_as_manager.read(["name"])[0]["name"], "Test Project")
 
         # Remove from user_ids, add to manager_ids - should read
         self.project.write(
             {"user_ids": [(3, self.manager.id)], "manager_ids": [(4, self.manager.id)]}
         )
-        self.assertEqual(manager_project.browse(self.project.id).name, "Test Project")
+        self.assertEqual(project_as_manager.read(["name"])[0]["name"], "Test Project")
 
     def test_manager_write_access(self):
         """Test manager write/create access rules"""
@@ -149,34 +150,18 @@ class TestProject(CommonTest):
 
         # -- 2 --
         # Create servers with multiple users and managers
-        server_1 = self.Server.create(
-            {
-                "name": "Test Server 1",
-                "ip_v4_address": "localhost",
-                "ssh_username": "admin",
-                "ssh_password": "password",
-                "os_id": self.os_debian_10.id,
-                "user_ids": [(6, 0, [self.user_bob.id, self.user.id])],  # Two users
-                "manager_ids": [
-                    (6, 0, [self.manager.id, self.manager_2.id])
-                ],  # Two managers
-            }
+        server_1 = self.create_server(
+            "Test Server 1",
+            user_ids=[(6, 0, [self.user_bob.id, self.user.id])],  # Two users
+            manager_ids=[(6, 0, [self.manager.id, self.manager_2.id])],  # Two managers
         )
 
-        server_2 = self.Server.create(
-            {
-                "name": "Test Server 2",
-                "ip_v4_address": "localhost",
-                "ssh_username": "admin",
-                "ssh_password": "password",
-                "os_id": self.os_debian_10.id,
-                "user_ids": [
-                    (6, 0, [self.user_bob.id, self.user.id])
-                ],  # Same two users
-                "manager_ids": [
-                    (6, 0, [self.manager.id, self.manager_2.id])
-                ],  # Same two managers
-            }
+        server_2 = self.create_server(
+            "Test Server 2",
+            user_ids=[(6, 0, [self.user_bob.id, self.user.id])],  # Same two users
+            manager_ids=[
+                (6, 0, [self.manager.id, self.manager_2.id])
+            ],  # Same two managers
         )
 
         # Create project and link servers
@@ -187,24 +172,31 @@ class TestProject(CommonTest):
         )
 
         # Create files and link them to the project
-        for server in [server_1, server_2]:
-            file = self.File.create(
+        servers = server_1 | server_2
+        files = self.File.create(
+            [
                 {
                     "name": f"test_file_{server.name}",
                     "server_id": server.id,
                 }
-            )
-            self.GitProjectRel.create(
+                for server in servers
+            ]
+        )
+        self.GitProjectRel.create(
+            [
                 {
                     "server_id": server.id,
                     "file_id": file.id,
                     "git_project_id": project.id,
                     "project_format": "git_aggregator",
                 }
-            )
+                for server, file in zip(servers, files)
+            ]
+        )
 
-        # Invalidate cache to ensure computed fields are updated
-        project.invalidate_recordset(["server_ids", "user_ids", "manager_ids"])
+        # Servers are read from the relation table directly, refresh them.
+        # Users and managers are recomputed through their dependencies.
+        project.invalidate_recordset(["server_ids"])
 
         # -- 3 --
         # Test computed values with linked servers
@@ -219,16 +211,10 @@ class TestProject(CommonTest):
 
         # -- 4 --
         # Add server with different users/managers
-        server_3 = self.Server.create(
-            {
-                "name": "Test Server 3",
-                "ip_v4_address": "localhost",
-                "ssh_username": "admin",
-                "ssh_password": "password",
-                "os_id": self.os_debian_10.id,
-                "user_ids": [(6, 0, [self.user_bob.id])],  # Only one user
-                "manager_ids": [(6, 0, [self.manager_2.id])],  # Only second manager
-            }
+        server_3 = self.create_server(
+            "Test Server 3",
+            user_ids=[(6, 0, [self.user_bob.id])],  # Only one user
+            manager_ids=[(6, 0, [self.manager_2.id])],  # Only second manager
         )
         file_3 = self.File.create(
             {
@@ -245,8 +231,9 @@ class TestProject(CommonTest):
             }
         )
 
-        # Invalidate cache to ensure computed fields are updated
-        project.invalidate_recordset(["server_ids", "user_ids", "manager_ids"])
+        # Servers are read from the relation table directly, refresh them.
+        # Users and managers are recomputed through their dependencies.
+        project.invalidate_recordset(["server_ids"])
 
         # Test that computed values are updated correctly
         # Only users/managers present in all servers should remain
@@ -268,48 +255,9 @@ class TestProject(CommonTest):
 
     def test_manager_server_based_access(self):
         """Test manager access through server relationships"""
-        manager_project = self.GitProject.with_user(self.manager)
-
-        # Create a server where manager is a user
-        server = self.Server.create(
-            {
-                "name": "Test Server",
-                "ip_v4_address": "localhost",
-                "ssh_username": "admin",
-                "ssh_password": "password",
-                "os_id": self.os_debian_10.id,
-                "user_ids": [(4, self.manager.id)],
-            }
+        self.check_server_based_read_access(
+            self.project,
+            self.GitProject.with_user(self.manager).browse(self.project.id),
+            "name",
+            "Test Project",
         )
-
-        # Create a file and link project to server
-        file = self.File.create(
-            {
-                "name": "test_file",
-                "server_id": server.id,
-            }
-        )
-        self.GitProjectRel.create(
-            {
-                "server_id": server.id,
-                "file_id": file.id,
-                "git_project_id": self.project.id,
-                "project_format": "git_aggregator",
-            }
-        )
-
-        # Manager should be able to read project through server relationship
-        self.assertEqual(manager_project.browse(self.project.id).name, "Test Project")
-
-        # Remove manager from server users
-        server.write({"user_ids": [(3, self.manager.id)]})
-
-        # Manager should not be able to read project anymore
-        with self.assertRaises(AccessError):
-            manager_project.browse(self.project.id).read(["name"])
-
-        # Add manager to server managers
-        server.write({"manager_ids": [(4, self.manager.id)]})
-
-        # Manager should be able to read project again
-        self.assertEqual(manager_project.browse(self.project.id).name, "Test Project")
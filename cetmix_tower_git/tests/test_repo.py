@@ -82,3 +82,43 @@ class TestRepo(CommonTest):
                     "url": "random string",
                 }
             )
+
+    def test_repo_create_same_repo_multiple_urls(self):
+        """Test if repository is created once for different URLs of it"""
+        repos = self.Repo.create(
+            [
+                {"url": "https://github.com/memes-demo/doge-memes.git"},
+                {"url": "git@github.com:memes-demo/doge-memes.git"},
+            ]
+        )
+        self.assertEqual(len(repos), 1)
+        self.assertEqual(repos.name, "github.com/memes-demo/doge-memes")
+
+        # Existing repository is returned for another URL of it
+        repo = self.Repo.create(
+            {"url": "git://github.com/memes-demo/doge-memes.git"},
+        )
+        self.assertEqual(repo, repos)
+
+    def test_repo_create_owner_case_insensitive(self):
+        """Test if URLs differing only in owner case share owner and repo"""
+        repo_upper = self.Repo.create(
+            {"url": "https://github.com/MEMES-Demo/cat-memes.git"},
+        )
+        repo_lower = self.Repo.create(
+            {"url": "https://github.com/memes-demo/cat-memes.git"},
+        )
+        self.assertEqual(repo_lower, repo_upper)
+        self.assertEqual(repo_upper.owner_id.name, "MEMES-Demo")
+
+        # Same in a single call
+        repos = self.Repo.create(
+            [
+                {"url": "git@github.com:Memes-Demo/cat-memes.git"},
+                {"url": "https://github.com/memes-DEMO/cat-memes.git"},
+            ]
+        )
+        self.assertEqual(repos, repo_upper)
+        self.assertEqual(
+            self.RepoOwner.search_count([("name_key", "=", "memes-demo")]), 1
+        )
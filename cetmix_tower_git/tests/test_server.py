@@ -3,6 +3,8 @@ try:
 except ImportError:
     trap_jobs = None
 
+from odoo.exceptions import AccessError
+
 from .common import CommonTest
 
 
@@ -197,3 +199,37 @@ class TestServer(CommonTest):
             self.repo_cetmix_tower.url, "main", "commit"
         )
         self.assertFalse(servers)
+
+    def test_server_get_servers_by_git_ref_access(self):
+        """Check that servers are returned only through readable relations"""
+        # Link the project to a server where the manager is a user
+        server = self.create_server("Test Server", user_ids=[(4, self.manager.id)])
+        file = self.File.create(
+            {
+                "name": "test_file",
+                "server_id": server.id,
+            }
+        )
+        self.GitProjectRel.create(
+            {
+                "server_id": server.id,
+                "file_id": file.id,
+                "git_project_id": self.git_project_1.id,
+                "project_format": "git_aggregator",
+            }
+        )
+        repository_url = self.remote_github_https.repo_id.url
+        manager_server = self.Server.with_user(self.manager)
+
+        # Manager can read the server but not the project linking it,
+        # because the manager is not a user of all project servers
+        self.assertEqual(
+            manager_server.browse(server.id).read(["name"])[0]["name"], "Test Server"
+        )
+        with self.assertRaises(AccessError):
+            self.git_project_1.with_user(self.manager).read(["name"])
+        self.assertFalse(manager_server.get_servers_by_git_ref(repository_url))
+
+        # Add manager to project users - server is returned
+        self.git_project_1.write({"user_ids": [(4, self.manager.id)]})
+        self.assertEqual(manager_server.get_servers_by_git_ref(repository_url), server)
@@ -54,20 +54,21 @@ class TestSource(CommonTest):
     def test_manager_read_access(self):
         """Test manager read access rules"""
         manager_source = self.GitSource.with_user(self.manager)
+        source_as_manager = manager_source.browse(self.source.id)
 
         # Manager not in project user_ids or manager_ids - should not read
         with self.assertRaises(AccessError):
-            manager_source.browse(self.source.id).read(["name"])
+            source_as_manager.read(["name"])
 
         # Add manager to project user_ids - should read
         self.project.write({"user_ids": [(4, self.manager.id)]})
-        self.assertEqual(manager_source.browse(self.source.id).name, "Test Source")
+        self.assertEqual(source_as_manager.read(["name"])[0]["name"], "Test Source")
 
         # Remove from user_ids, add to manager_ids - should read
         self.project.write(
             {"user_ids": [(3, self.manager.id)], "manager_ids": [(4, self.manager.id)]}
         )
-        self.assertEqual(manager_source.browse(self.source.id).name, "Test Source")
+        self.assertEqual(source_as_manager.read(["name"])[0]["name"], "Test Source")
 
     def test_manager_write_access(self):
         """Test manager write/create access rules"""
@@ -179,48 +180,9 @@ class TestSource(CommonTest):
 
     def test_manager_server_based_access(self):
         """Test manager access to sources through server relationships"""
-        manager_source = self.GitSource.with_user(self.manager)
-
-        # Create a server where manager is a user
-        server = self.Server.create(
-            {
-                "name": "Test Server",
-                "ip_v4_address": "localhost",
-                "ssh_username": "admin",
-                "ssh_password": "password",
-                "os_id": self.os_debian_10.id,
-                "user_ids": [(4, self.manager.id)],
-            }
-        )
-
-        # Link project to server
-        file = self.File.create(
-            {
-                "name": "test_file",
-                "server_id": server.id,
-            }
-        )
-        self.GitProjectRel.create(
-            {
-                "server_id": server.id,
-                "file_id": file.id,
-                "git_project_id": self.project.id,
-                "project_format": "git_aggregator",
-            }
+        self.check_server_based_read_access(
+            self.project,
+            self.GitSource.with_user(self.manager).browse(self.source.id),
+            "name",
+            "Test Source",
         )
-
-        # Manager should be able to read source through server relationship
-        self.assertEqual(manager_source.browse(self.source.id).name, "Test Source")
-
-        # Remove manager from server users
-        server.write({"user_ids": [(3, self.manager.id)]})
-
-        # Manager should not be able to read source anymore
-        with self.assertRaises(AccessError):
-            manager_source.browse(self.source.id).read(["name"])
-
-        # Add manager to server managers
-        server.write({"manager_ids": [(4, self.manager.id)]})
-
-        # Manager should be able to read source again
-        self.assertEqual(manager_source.browse(self.source.id).name, "Test Source")